@@ -8,6 +8,7 @@ from omnigibson.tasks import REGISTERED_TASKS
 from omnigibson.scenes import REGISTERED_SCENES
 from omnigibson.utils.gym_utils import GymObservable, recursively_generate_flat_dict
 from omnigibson.utils.config_utils import parse_config
+import omnigibson.utils.fastmath_utils as FM
 from omnigibson.utils.ui_utils import create_module_logger
 from omnigibson.utils.python_utils import assert_valid_key, merge_nested_dicts, create_class_from_registry_and_config,\
     Recreatable
@@ -54,6 +55,7 @@ class Environment(gym.Env, GymObservable, Recreatable):
 
         # Initialize other placeholders that will be filled in later
         self._initial_pos_z_offset = None                   # how high to offset object placement to account for one action step of dropping
+        self._render_every_n_steps = None                   # how many env steps to take in between rendering frames
         self._task = None
         self._loaded = None
         self._current_episode = 0
@@ -77,6 +79,9 @@ class Environment(gym.Env, GymObservable, Recreatable):
         og.sim.viewer_height = self.render_config["viewer_height"]
         og.sim.device = device
 
+        # Compile (or load from cache) any JIT-compiled math kernels now, so that this doesn't happen mid-episode
+        FM.warmup()
+
         # Load this environment
         self.load()
 
@@ -129,6 +134,7 @@ class Environment(gym.Env, GymObservable, Recreatable):
         """
         # Store additional variables after config has been loaded fully
         self._initial_pos_z_offset = self.env_config["initial_pos_z_offset"]
+        self._render_every_n_steps = self.render_config["render_every_n_steps"]
 
         # Reset bookkeeping variables
         self._reset_variables()
@@ -153,6 +159,10 @@ class Environment(gym.Env, GymObservable, Recreatable):
         drop_distance = 0.5 * 9.8 * (self.action_timestep ** 2)
         assert drop_distance < self._initial_pos_z_offset, "initial_pos_z_offset is too small for collision checking"
 
+        # Check to make sure our rendering period is valid
+        assert isinstance(self._render_every_n_steps, int) and self._render_every_n_steps >= 1, \
+            f"render_every_n_steps must be a positive integer, got: {self._render_every_n_steps}"
+
     def _load_task(self):
         """
         Load task
@@ -397,8 +407,9 @@ class Environment(gym.Env, GymObservable, Recreatable):
         for robot in self.robots:
             robot.apply_action(action_dict[robot.name])
 
-        # Run simulation step
-        og.sim.step()
+        # Run simulation step, only rendering every self._render_every_n_steps steps. In between rendered frames,
+        # vision sensors return the most recently rendered frame
+        og.sim.step(render=(self._current_step + 1) % self._render_every_n_steps == 0)
 
         # Grab observations
         obs = self.get_obs()
@@ -558,6 +569,7 @@ class Environment(gym.Env, GymObservable, Recreatable):
             "render": {
                 "viewer_width": 1280,
                 "viewer_height": 720,
+                "render_every_n_steps": 1,
             },
 
             # Scene kwargs
@@ -41,6 +41,10 @@ gm.ENABLE_OBJECT_STATES = False
 gm.ENABLE_TRANSITION_RULES = False
 gm.ENABLE_FLATCACHE = True
 
+# Our image observations have a fixed resolution, so let cuDNN benchmark and pick the fastest convolution kernels
+# for the feature extractor's conv layers once, instead of using the default heuristics at every forward pass
+th.backends.cudnn.benchmark = True
+
 
 class CustomCombinedExtractor(BaseFeaturesExtractor):
     def __init__(self, observation_space: gym.spaces.Dict):
@@ -53,6 +53,7 @@ class TraversableMap(BaseMap):
         self.mesh_body_id = None
         self.floor_heights = None
         self.floor_map = None
+        self.floor_trav_space = None
         self.floor_graph = None
 
         # Run super method
@@ -75,6 +76,7 @@ class TraversableMap(BaseMap):
 
         self.floor_heights = floor_heights
         self.floor_map = []
+        self.floor_trav_space = []
         map_size = None
         for floor in range(len(self.floor_heights)):
             if self.trav_map_with_objects:
@@ -112,6 +114,10 @@ class TraversableMap(BaseMap):
 
             self.floor_map.append(trav_map)
 
+            # Cache the (row, col) map coordinates of all traversable pixels, so that random points can be sampled
+            # without searching through the entire map every time
+            self.floor_trav_space.append(np.argwhere(trav_map == 255))
+
         return map_size
 
     # TODO: refactor into C++ for speedup
@@ -193,10 +199,9 @@ class TraversableMap(BaseMap):
         """
         if floor is None:
             floor = np.random.randint(0, self.n_floors)
-        trav = self.floor_map[floor]
-        trav_space = np.where(trav == 255)
-        idx = np.random.randint(0, high=trav_space[0].shape[0])
-        xy_map = np.array([trav_space[0][idx], trav_space[1][idx]])
+        trav_space = self.floor_trav_space[floor]
+        idx = np.random.randint(0, high=trav_space.shape[0])
+        xy_map = trav_space[idx]
         x, y = self.map_to_world(xy_map)
         z = self.floor_heights[floor]
         return floor, np.array([x, y, z])
@@ -6,6 +6,16 @@ from omnigibson.utils.sim_utils import prims_to_rigid_prim_set
 class ContactBodies(AbsoluteObjectState):
 
     def _get_value(self, ignore_objs=None):
+        # Ignore_objs should either be None or tuple (CANNOT be list because we need to hash these inputs)
+        assert ignore_objs is None or isinstance(ignore_objs, tuple), \
+            "ignore_objs must either be None or a tuple of objects to ignore!"
+
+        # If we're filtering, reuse the unfiltered bodies in contact, which are cached for the current timestep. This
+        # way the raw contacts are only queried and parsed once per timestep, no matter how many different
+        # @ignore_objs combinations are queried (e.g.: by different reward functions and termination conditions)
+        if ignore_objs is not None:
+            return self.get_value() - prims_to_rigid_prim_set(ignore_objs)
+
         # Compute bodies in contact, minus the self-owned bodies
         bodies = set()
         for contact in self.obj.contact_list():
@@ -19,7 +29,4 @@ class ContactBodies(AbsoluteObjectState):
             obj = og.sim.scene.object_registry("prim_path", obj_prim_path)
             if obj is not None:
                 rigid_prims.add(obj.links[link_name])
-        # Ignore_objs should either be None or tuple (CANNOT be list because we need to hash these inputs)
-        assert ignore_objs is None or isinstance(ignore_objs, tuple), \
-            "ignore_objs must either be None or a tuple of objects to ignore!"
-        return rigid_prims if ignore_objs is None else rigid_prims - prims_to_rigid_prim_set(ignore_objs)
+        return rigid_prims
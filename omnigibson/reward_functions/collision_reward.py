@@ -21,16 +21,41 @@ class CollisionReward(BaseRewardFunction):
         self._robot_idn = robot_idn
         self._ignore_self_collisions = ignore_self_collisions
         self._r_collision = r_collision
+        self._ignore_objs = None
+        self._ignore_objs_scene = None
 
         # Run super
         super().__init__()
 
+    def reset(self, task, env):
+        # Call super first
+        super().reset(task, env)
+
+        # Clear the cached objects to ignore, so that they're recompiled at the next step
+        self._ignore_objs, self._ignore_objs_scene = None, None
+
+    def _get_ignore_objs(self, env):
+        """
+        Get the objects whose collisions should be ignored, i.e.: floors and potentially robot's own prims as well.
+        These are only compiled once per scene, since the scene may be swapped (e.g.: via og.sim.restore()) without
+        this reward function being reset
+
+        Args:
+            env (Environment): Environment instance
+
+        Returns:
+            tuple of BaseObject: Objects whose collisions should be ignored
+        """
+        if self._ignore_objs_scene is not env.scene:
+            robot = env.robots[self._robot_idn]
+            floors = list(env.scene.object_registry("category", "floors", []))
+            ignore_objs = floors if self._ignore_self_collisions is None else floors + [robot]
+            self._ignore_objs, self._ignore_objs_scene = tuple(ignore_objs), env.scene
+        return self._ignore_objs
+
     def _step(self, task, env, action):
         # Penalty is Reward is -self._r_collision if there were any collisions in the last timestep
-        robot = env.robots[self._robot_idn]
-        # Ignore floors and potentially robot's own prims as well
-        floors = list(env.scene.object_registry("category", "floors", []))
-        ignore_objs = floors if self._ignore_self_collisions is None else floors + [robot]
-        in_contact = len(env.robots[self._robot_idn].states[ContactBodies].get_value(ignore_objs=tuple(ignore_objs))) > 0
+        ignore_objs = self._get_ignore_objs(env=env)
+        in_contact = len(env.robots[self._robot_idn].states[ContactBodies].get_value(ignore_objs=ignore_objs)) > 0
         reward = float(in_contact) * -self._r_collision
         return reward, {}
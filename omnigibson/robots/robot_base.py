@@ -1,14 +1,13 @@
 from abc import abstractmethod
 from copy import deepcopy
 import numpy as np
-import matplotlib.pyplot as plt
 from omnigibson.macros import gm, create_module_macros
 from omnigibson.sensors import create_sensor, SENSOR_PRIMS_TO_SENSOR_CLS, ALL_SENSOR_MODALITIES, VisionSensor, ScanSensor
 from omnigibson.objects.usd_object import USDObject
 from omnigibson.objects.controllable_object import ControllableObject
 from omnigibson.utils.gym_utils import GymObservable
 from omnigibson.utils.python_utils import classproperty
-from omnigibson.utils.vision_utils import segmentation_to_rgb
+from omnigibson.utils.vision_utils import randomize_colors, segmentation_to_rgb
 from omnigibson.utils.constants import PrimType
 from pxr import PhysxSchema
 
@@ -32,6 +31,10 @@ class BaseRobot(USDObject, ControllableObject, GymObservable):
     This class handles object loading, and provides method interfaces that should be
     implemented by subclassed robots.
     """
+
+    # Color palette used when visualizing instance segmentation. Generated once and reused across frames and robots
+    _SEG_INSTANCE_COLORS = None
+
     def __init__(
         self,
         # Shared kwargs in hierarchy
@@ -312,8 +315,10 @@ class BaseRobot(USDObject, ControllableObject, GymObservable):
                             # Ignore alpha channel, map to floats
                             ob = ob[:, :, :3] / 255.0
                         elif modality == "seg_instance":
-                            # Map IDs to rgb
-                            ob = segmentation_to_rgb(ob, N=256) / 255.0
+                            # Map IDs to rgb using the cached palette. The resulting uint8 image can be plotted directly
+                            if BaseRobot._SEG_INSTANCE_COLORS is None:
+                                BaseRobot._SEG_INSTANCE_COLORS = randomize_colors(N=256, bright=True)
+                            ob = segmentation_to_rgb(ob, N=256, colors=BaseRobot._SEG_INSTANCE_COLORS)
                         elif modality == "normal":
                             # Re-map to 0 - 1 range
                             ob = (ob + 1.0) / 2.0
@@ -340,7 +345,8 @@ class BaseRobot(USDObject, ControllableObject, GymObservable):
         if len(remaining_obs_modalities) > 0:
             print(f"Modalities: {remaining_obs_modalities} cannot be visualized, skipping...")
 
-        # Write all the frames to a plot
+        # Write all the frames to a plot. matplotlib is imported here since it is only needed for visualization
+        import matplotlib.pyplot as plt
         for sensor_name, sensor_frames in frames.items():
             n_sensor_frames = len(sensor_frames)
             if n_sensor_frames > 0:
@@ -9,6 +9,7 @@ from omni.isaac.range_sensor import _range_sensor
 
 from omnigibson.sensors.sensor_base import BaseSensor
 from omnigibson.utils.constants import OccupancyGridState
+import omnigibson.utils.fastmath_utils as FM
 from omnigibson.utils.python_utils import classproperty
 
 
@@ -85,6 +86,12 @@ class ScanSensor(BaseSensor):
         # Create variables that will be filled in at runtime
         self._rs = None                 # Range sensor interface, analagous to others, e.g.: dynamic control interface
 
+        # Maps (horizontal_fov, horizontal_resolution) to the corresponding (N, 3) scan line unit vectors
+        self._laser_unit_vectors = dict()
+
+        # Scratch buffer that the occupancy grid gets drawn into, re-used across steps to avoid re-allocating it
+        self._occupancy_grid = np.zeros((occupancy_grid_resolution, occupancy_grid_resolution), dtype=np.uint8)
+
         # Create load config from inputs
         load_config = dict() if load_config is None else load_config
         load_config["min_range"] = min_range
@@ -166,15 +173,8 @@ class ScanSensor(BaseSensor):
         assert "occupancy_grid" in self._modalities, "Occupancy grid is not enabled for this range sensor!"
         assert self.n_vertical_rays == 1, "Occupancy grid is only valid for a 1D range sensor (n_vertical_rays = 1)!"
 
-        # Grab vector of corresponding angles for each scan line
-        angles = np.arange(
-            -np.radians(self.horizontal_fov / 2),
-            np.radians(self.horizontal_fov / 2),
-            np.radians(self.horizontal_resolution),
-        )
-
-        # Convert into 3D unit vectors for each angle
-        unit_vector_laser = np.array([[np.cos(ang), np.sin(ang), 0.0] for ang in angles])
+        # Grab 3D unit vectors for each scan line
+        unit_vector_laser = self._get_laser_unit_vectors()
 
         # Scale unit vectors by corresponding laser scan distnaces
         assert ((scan >= 0.0) & (scan <= 1.0)).all(), "scan out of valid range [0, 1]"
@@ -193,8 +193,8 @@ class ScanSensor(BaseSensor):
         # flip y axis
         scan_local[:, 1] *= -1
 
-        # Initialize occupancy grid -- default is unknown values
-        occupancy_grid = np.zeros((self.occupancy_grid_resolution, self.occupancy_grid_resolution)).astype(np.uint8)
+        # Reset occupancy grid -- default is unknown values
+        occupancy_grid = self._occupancy_grid
         occupancy_grid.fill(int(OccupancyGridState.UNKNOWN * 2.0))
 
         # Convert local scans into the corresponding OG square it should belong to (note now all values are > 0, since
@@ -223,7 +223,31 @@ class ScanSensor(BaseSensor):
             thickness=-1,
         )
 
-        return occupancy_grid[:, :, None].astype(np.float32) / 2.0
+        # Convert to float in a single pass. Note that this creates a new array, so the returned grid is never
+        # overwritten by subsequent calls
+        return np.multiply(occupancy_grid[:, :, None], 0.5, dtype=np.float32)
+
+    def _get_laser_unit_vectors(self):
+        """
+        Get the 3D unit vectors corresponding to each horizontal scan line, in this sensor's frame. These only depend
+        on the sensor's horizontal FOV and resolution, so they are computed once and cached
+
+        Returns:
+            (N, 3)-array: Unit vector for each of the N horizontal scan lines
+        """
+        key = (self.horizontal_fov, self.horizontal_resolution)
+        if key not in self._laser_unit_vectors:
+            # Grab vector of corresponding angles for each scan line
+            fov, resolution = key
+            angles = np.arange(-np.radians(fov / 2), np.radians(fov / 2), np.radians(resolution))
+
+            # Convert into 3D unit vectors for each angle, filling in each coordinate column in a single pass
+            unit_vectors = np.zeros((len(angles), 3))
+            unit_vectors[:, 0] = np.cos(angles)
+            unit_vectors[:, 1] = np.sin(angles)
+            self._laser_unit_vectors[key] = unit_vectors
+
+        return self._laser_unit_vectors[key]
 
     def _get_obs(self):
         # Run super first to grab any upstream obs
@@ -232,9 +256,9 @@ class ScanSensor(BaseSensor):
         # Add scan info (normalized to [0.0, 1.0])
         if "scan" in self._modalities:
             raw_scan = self._rs.get_linear_depth_data(self._prim_path)
-            # Sometimes get_linear_depth_data will return values that are slightly out of range, needs clipping
-            raw_scan = np.clip(raw_scan, self.min_range, self.max_range)
-            obs["scan"] = (raw_scan - self.min_range) / (self.max_range - self.min_range)
+            # Sometimes get_linear_depth_data will return values that are slightly out of range, needs clipping.
+            # Clipping and normalizing are fused into a single pass over the scan
+            obs["scan"] = FM.clip_normalize(np.ascontiguousarray(raw_scan), self.min_range, self.max_range)
 
             # Optionally add occupancy grid info
             if "occupancy_grid" in self._modalities:
@@ -119,6 +119,8 @@ class VisionSensor(BaseSensor):
         # Create variables that will be filled in later at runtime
         self._sd = None             # synthetic data interface
         self._viewport = None       # Viewport from which to grab data
+        self._modality_kwargs = None    # Maps each active modality to the kwargs passed to its sensor helper
+        self._raw_sensor_names = set()  # Names of raw sensors that have already been created for this viewport
 
         # Run super method
         super().__init__(
@@ -195,6 +197,9 @@ class VisionSensor(BaseSensor):
         # Initialize sensors
         self.initialize_sensors(names=self._modalities)
 
+        # Compile the sensor helper kwargs for all active modalities
+        self._modality_kwargs = {modality: self._get_modality_kwargs(modality) for modality in self._modalities}
+
     def initialize_sensors(self, names):
         """Initializes a raw sensor in the simulation.
 
@@ -202,14 +207,18 @@ class VisionSensor(BaseSensor):
             names (str or list of str): Name of the raw sensor(s) to initialize.
                 If they are not part of self._RAW_SENSOR_TYPES' keys, we will simply pass over them
         """
-        # Standardize the input and grab the intersection with all possible raw sensors
+        # Standardize the input and grab the intersection with all possible raw sensors that haven't been created yet
         names = set([names]) if isinstance(names, str) else set(names)
-        names = names.intersection(set(self._RAW_SENSOR_TYPES.keys()))
+        names = names.intersection(set(self._RAW_SENSOR_TYPES.keys())) - self._raw_sensor_names
 
-        # Initialize sensors
-        sensors = []
+        # If there are no new raw sensors, there is nothing new to render, so we can terminate early
+        if len(names) == 0:
+            return
+
+        # Create all requested raw sensors at once so that they are all populated by the same render frames below
         for name in names:
-            sensors.append(sensors_util.create_or_retrieve_sensor(self._viewport.viewport_api, self._RAW_SENSOR_TYPES[name]))
+            sensors_util.create_or_retrieve_sensor(self._viewport.viewport_api, self._RAW_SENSOR_TYPES[name])
+        self._raw_sensor_names.update(names)
 
         # Suppress syntheticdata warning here because we know the first render is invalid
         with suppress_omni_log(channels=["omni.syntheticdata.plugin"]):
@@ -223,14 +232,9 @@ class VisionSensor(BaseSensor):
         # Run super first to grab any upstream obs
         obs = super()._get_obs()
 
-        # Process each sensor modality individually
-        for modality in self.modalities:
-            mod_kwargs = dict()
-            mod_kwargs["viewport"] = self._viewport.viewport_api
-            if modality == "seg_instance":
-                mod_kwargs.update({"parsed": True, "return_mapping": False})
-            elif modality == "bbox_3d":
-                mod_kwargs.update({"parsed": True, "return_corners": True})
+        # All modalities read from the same frame rendered during the most recent sim step, so we simply grab each
+        # modality's buffer using its pre-compiled helper kwargs
+        for modality, mod_kwargs in self._modality_kwargs.items():
             obs[modality] = self._SENSOR_HELPERS[modality](**mod_kwargs)
 
         return obs
@@ -245,6 +249,35 @@ class VisionSensor(BaseSensor):
         # We also need to initialize this new modality
         if should_initialize:
             self.initialize_sensors(names=modality)
+            # Only update the helper kwargs if they've already been compiled; otherwise they'll be compiled at init
+            if self._modality_kwargs is not None:
+                self._modality_kwargs[modality] = self._get_modality_kwargs(modality)
+
+    def remove_modality(self, modality):
+        # Run super
+        super().remove_modality(modality=modality)
+
+        # Stop grabbing this modality's data
+        if self._modality_kwargs is not None:
+            self._modality_kwargs.pop(modality, None)
+
+    def _get_modality_kwargs(self, modality):
+        """
+        Compiles the keyword arguments to pass to @modality's sensor helper when grabbing its data
+
+        Args:
+            modality (str): Name of the modality whose sensor helper kwargs should be compiled
+
+        Returns:
+            dict: Keyword-mapped arguments to pass to self._SENSOR_HELPERS[@modality]
+        """
+        mod_kwargs = dict()
+        mod_kwargs["viewport"] = self._viewport.viewport_api
+        if modality == "seg_instance":
+            mod_kwargs.update({"parsed": True, "return_mapping": False})
+        elif modality == "bbox_3d":
+            mod_kwargs.update({"parsed": True, "return_corners": True})
+        return mod_kwargs
 
     def get_local_pose(self):
         # We have to overwrite this because camera prims can't set their quat for some reason ):
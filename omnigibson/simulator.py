@@ -433,6 +433,10 @@ class Simulator(SimulationContext, Serializable):
                     obj.initialize()
                     if len(obj.states.keys() & self.object_state_types_on_contact) > 0:
                         self._objects_require_contact_callback = True
+                        # Only subscribe to contact report events once some object actually needs them, since
+                        # otherwise every contact would be marshalled into python after each physics step for nothing
+                        if gm.ENABLE_OBJECT_STATES and self._contact_callback is None:
+                            self._contact_callback = self._physics_context._physx_sim_interface.subscribe_contact_report_events(self._on_contact)
                     if len(obj.states.keys() & self.object_state_types_on_joint_break) > 0:
                         self._objects_require_joint_break_callback = True
 
@@ -897,6 +901,7 @@ class Simulator(SimulationContext, Serializable):
         self._objects_to_initialize = []
         self._objects_require_contact_callback = False
         self._objects_require_joint_break_callback = False
+        self._contact_callback = None
         self._link_id_to_objects = dict()
 
         self._callbacks_on_play = dict()
@@ -1097,7 +1102,8 @@ class Simulator(SimulationContext, Serializable):
         self._stage_open_callback = (
             omni.usd.get_context().get_stage_event_stream().create_subscription_to_pop(self._stage_open_callback_fn)
         )
-        self._contact_callback = self._physics_context._physx_sim_interface.subscribe_contact_report_events(self._on_contact)
+        # Contact report events are only subscribed to lazily, once an object with contact-based states is initialized
+        self._contact_callback = None
         self._simulation_event_callback = self._physx_interface.get_simulation_event_stream_v2().create_subscription_to_pop(self._on_simulation_event)
 
         # Set the lighting mode to be stage by default
@@ -1,5 +1,4 @@
 import os
-import matplotlib.pyplot as plt
 import omni
 from omni.isaac.core.utils.prims import get_prim_at_path
 from pxr import UsdPhysics
@@ -205,7 +204,12 @@ class MacroParticleSystem(BaseSystem):
         color = np.ones(3)
         if obj.has_material():
             diffuse_texture = obj.material.diffuse_texture
-            color = plt.imread(diffuse_texture).mean(axis=(0, 1)) if diffuse_texture else obj.material.diffuse_color_constant
+            if diffuse_texture:
+                # Only import matplotlib if we actually need to read a texture image
+                import matplotlib.pyplot as plt
+                color = plt.imread(diffuse_texture).mean(axis=(0, 1))
+            else:
+                color = obj.material.diffuse_color_constant
         cls._color = color
         cls._particle_object = obj
 
@@ -15,6 +15,7 @@ from omnigibson.termination_conditions.timeout import Timeout
 from omnigibson.utils.python_utils import classproperty, assert_valid_key
 from omnigibson.utils.sim_utils import land_object, test_valid_pose
 import omnigibson.utils.transform_utils as T
+import omnigibson.utils.fastmath_utils as FM
 from omnigibson.utils.ui_utils import create_module_logger
 
 # Create module logger
@@ -161,6 +162,8 @@ class PointNavigationTask(BaseTask):
         Args:
             env (Environment): Active environment instance
         """
+        # Note: All markers are visual-only and never move on their own, so we fix their bases. This makes them
+        # kinematic-only, which excludes them from the physics dynamics and the rigid body contact view
         if self._visualize_goal:
             self._initial_pos_marker = PrimitiveObject(
                 prim_path="/World/task_initial_pos_marker",
@@ -169,6 +172,7 @@ class PointNavigationTask(BaseTask):
                 radius=self._goal_tolerance,
                 height=self._goal_height,
                 visual_only=True,
+                fixed_base=True,
                 rgba=np.array([1, 0, 0, 0.3]),
             )
             self._goal_pos_marker = PrimitiveObject(
@@ -178,6 +182,7 @@ class PointNavigationTask(BaseTask):
                 radius=self._goal_tolerance,
                 height=self._goal_height,
                 visual_only=True,
+                fixed_base=True,
                 rgba=np.array([0, 0, 1, 0.3]),
             )
 
@@ -196,6 +201,7 @@ class PointNavigationTask(BaseTask):
                     radius=self._waypoint_width,
                     height=self._waypoint_height,
                     visual_only=True,
+                    fixed_base=True,
                     rgba=np.array([0, 1, 0, 0.3]),
                 )
                 og.sim.import_object(waypoint)
@@ -227,7 +233,7 @@ class PointNavigationTask(BaseTask):
             initial_pos = self._initial_pos
 
         # Possibly sample initial ori
-        initial_quat = T.euler2quat(np.array([0, 0, np.random.uniform(0, np.pi * 2)])) if \
+        initial_quat = FM.euler2quat(np.array([0.0, 0.0, np.random.uniform(0, np.pi * 2)])) if \
             self._randomize_initial_quat else self._initial_quat
 
         # Possibly sample goal pos
@@ -277,7 +283,7 @@ class PointNavigationTask(BaseTask):
         Returns:
             float: L2 distance to the target position
         """
-        return T.l2_distance(env.robots[self._robot_idn].states[Pose].get_value()[0][:2], self._goal_pos[:2])
+        return FM.l2_distance(env.robots[self._robot_idn].states[Pose].get_value()[0][:2], self._goal_pos[:2])
 
     def get_potential(self, env):
         """
@@ -364,8 +370,8 @@ class PointNavigationTask(BaseTask):
         Returns:
             3-array: (x,y,z) position in self._robot_idn agent's local frame
         """
-        delta_pos_global = np.array(pos) - env.robots[self._robot_idn].states[Pose].get_value()[0]
-        return T.quat2mat(env.robots[self._robot_idn].states[Pose].get_value()[1]).T @ delta_pos_global
+        robot_pos, robot_quat = env.robots[self._robot_idn].states[Pose].get_value()
+        return FM.relative_position(np.asarray(pos), robot_pos, robot_quat)
 
     def _get_obs(self, env):
         # Get relative position of goal with respect to the current agent position
@@ -374,9 +380,9 @@ class PointNavigationTask(BaseTask):
             xy_pos_to_goal = np.array(T.cartesian_to_polar(*xy_pos_to_goal))
 
         # linear velocity and angular velocity
-        ori_t = T.quat2mat(env.robots[self._robot_idn].states[Pose].get_value()[1]).T
-        lin_vel = ori_t @ env.robots[self._robot_idn].get_linear_velocity()
-        ang_vel = ori_t @ env.robots[self._robot_idn].get_angular_velocity()
+        robot_quat = env.robots[self._robot_idn].states[Pose].get_value()[1]
+        lin_vel = FM.quat_inverse_rotate(robot_quat, env.robots[self._robot_idn].get_linear_velocity())
+        ang_vel = FM.quat_inverse_rotate(robot_quat, env.robots[self._robot_idn].get_angular_velocity())
 
         # Compose observation dict
         low_dim_obs = dict(
@@ -452,7 +458,7 @@ class PointNavigationTask(BaseTask):
 
         # Update other internal variables
         new_robot_pos = env.robots[self._robot_idn].states[Pose].get_value()[0]
-        self._path_length += T.l2_distance(self._current_robot_pos[:2], new_robot_pos[:2])
+        self._path_length += FM.l2_distance(self._current_robot_pos[:2], new_robot_pos[:2])
         self._current_robot_pos = new_robot_pos
 
         return reward, done, info
@@ -21,6 +21,8 @@ class MaxCollision(FailureCondition):
         self._ignore_self_collisions = ignore_self_collisions
         self._max_collisions = max_collisions
         self._n_collisions = 0
+        self._ignore_objs = None
+        self._ignore_objs_scene = None
 
         # Run super init
         super().__init__()
@@ -32,11 +34,31 @@ class MaxCollision(FailureCondition):
         # Also reset collision counter
         self._n_collisions = 0
 
+        # Clear the cached objects to ignore, so that they're recompiled at the next step
+        self._ignore_objs, self._ignore_objs_scene = None, None
+
+    def _get_ignore_objs(self, env):
+        """
+        Get the objects whose collisions should be ignored, i.e.: floors and potentially robot's own prims as well.
+        These are only compiled once per scene, since the scene may be swapped (e.g.: via og.sim.restore()) without
+        this termination condition being reset
+
+        Args:
+            env (Environment): Environment instance
+
+        Returns:
+            tuple of BaseObject: Objects whose collisions should be ignored
+        """
+        if self._ignore_objs_scene is not env.scene:
+            robot = env.robots[self._robot_idn]
+            floors = list(env.scene.object_registry("category", "floors", []))
+            ignore_objs = floors if self._ignore_self_collisions is None else floors + [robot]
+            self._ignore_objs, self._ignore_objs_scene = tuple(ignore_objs), env.scene
+        return self._ignore_objs
+
     def _step(self, task, env, action):
         # Terminate if the robot has collided more than self._max_collisions times
-        robot = env.robots[self._robot_idn]
-        floors = list(env.scene.object_registry("category", "floors", []))
-        ignore_objs = floors if self._ignore_self_collisions is None else floors + [robot]
-        in_contact = len(env.robots[self._robot_idn].states[ContactBodies].get_value(ignore_objs=tuple(ignore_objs))) > 0
+        ignore_objs = self._get_ignore_objs(env=env)
+        in_contact = len(env.robots[self._robot_idn].states[ContactBodies].get_value(ignore_objs=ignore_objs)) > 0
         self._n_collisions += int(in_contact)
         return self._n_collisions > self._max_collisions
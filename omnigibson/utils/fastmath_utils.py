@@ -0,0 +1,196 @@
+"""
+Small, frequently-called math kernels that are JIT-compiled with numba when it is available.
+
+These are used in per-step code paths (e.g.: task observations and rewards) that only operate on a handful of numbers,
+where numpy's per-call dispatch overhead dominates the actual compute.
+
+NOTE: numba is an optional dependency. If it is not installed, every kernel falls back to an equivalent pure python /
+numpy implementation with the same signature, so callers never need to check for numba themselves. It can be installed
+via the "fastmath" extra, i.e.: pip install -e .[fastmath]
+NOTE: convention for quaternions is (x, y, z, w)
+"""
+import itertools
+import math
+
+import numpy as np
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+# Default kwargs passed to numba.njit. Compiled kernels are cached to disk so that they only need to be compiled once
+DEFAULT_JIT_KWARGS = dict(cache=True, fastmath=True)
+
+
+def jit(fallback=None, **jit_kwargs):
+    """
+    Decorator that JIT-compiles the decorated function with numba if numba is available
+
+    Args:
+        fallback (None or function): If specified, function to use instead of the decorated function if numba is not
+            available. This is useful for kernels that are written as explicit loops, which would be slow if run by
+            the python interpreter directly. If None, the decorated function itself will be used
+        jit_kwargs (dict): Any keyword arguments to pass to numba.njit. These override DEFAULT_JIT_KWARGS
+
+    Returns:
+        function: Decorator that wraps the function to compile
+    """
+    def decorator(fcn):
+        if numba is None:
+            return fcn if fallback is None else fallback
+        return numba.njit(**{**DEFAULT_JIT_KWARGS, **jit_kwargs})(fcn)
+
+    return decorator
+
+
+@jit()
+def l2_distance(v1, v2):
+    """
+    Computes the L2 distance between two 1D vectors
+
+    Args:
+        v1 (n-array): First vector
+        v2 (n-array): Second vector
+
+    Returns:
+        float: L2 distance between @v1 and @v2
+    """
+    dist = 0.0
+    for i in range(v1.shape[0]):
+        diff = v1[i] - v2[i]
+        dist += diff * diff
+    return math.sqrt(dist)
+
+
+@jit()
+def quat_inverse_rotate(quat, vec):
+    """
+    Rotates a 3D vector by the inverse of a unit quaternion, i.e.: expresses @vec in the frame defined by @quat.
+    Equivalent to quat2mat(quat).T @ vec
+
+    Args:
+        quat (4-array): (x,y,z,w) unit quaternion
+        vec (3-array): (x,y,z) vector to rotate
+
+    Returns:
+        3-array: (x,y,z) rotated vector
+    """
+    qx, qy, qz, qw = quat[0], quat[1], quat[2], quat[3]
+    vx, vy, vz = vec[0], vec[1], vec[2]
+
+    # v' = v - w * t + u x t, where u is the quaternion's vector part and t = 2 * (u x v)
+    tx = 2.0 * (qy * vz - qz * vy)
+    ty = 2.0 * (qz * vx - qx * vz)
+    tz = 2.0 * (qx * vy - qy * vx)
+
+    out = np.empty(3)
+    out[0] = vx - qw * tx + (qy * tz - qz * ty)
+    out[1] = vy - qw * ty + (qz * tx - qx * tz)
+    out[2] = vz - qw * tz + (qx * ty - qy * tx)
+    return out
+
+
+@jit()
+def relative_position(pos, base_pos, base_quat):
+    """
+    Converts a global 3D position into the local frame defined by a base pose
+
+    Args:
+        pos (3-array): (x,y,z) global position to convert
+        base_pos (3-array): (x,y,z) global position of the base frame
+        base_quat (4-array): (x,y,z,w) global unit quaternion orientation of the base frame
+
+    Returns:
+        3-array: (x,y,z) position of @pos expressed in the base frame
+    """
+    delta = np.empty(3)
+    for i in range(3):
+        delta[i] = pos[i] - base_pos[i]
+    return quat_inverse_rotate(base_quat, delta)
+
+
+def _clip_normalize(arr, low, high):
+    # Fallback implementation: single allocation with in-place numpy ops
+    out = np.clip(arr, low, high)
+    out -= low
+    out /= high - low
+    return out
+
+
+# Note: fastmath is disabled since raw sensor readings may contain NaN / Inf values, which must be handled like np.clip
+@jit(fallback=_clip_normalize, fastmath=False)
+def clip_normalize(arr, low, high):
+    """
+    Clips the values of an array to [@low, @high] and normalizes them to [0, 1], in a single pass over the array.
+    Equivalent to (np.clip(arr, low, high) - low) / (high - low), including for NaN (which is propagated) and Inf values
+
+    Args:
+        arr (np.array): C-contiguous array of values to clip and normalize
+        low (float): Lower bound of the valid value range
+        high (float): Upper bound of the valid value range
+
+    Returns:
+        np.array: Clipped and normalized array with the same shape and dtype as @arr
+    """
+    out = np.empty_like(arr)
+    arr_flat, out_flat = arr.reshape(arr.size), out.reshape(out.size)
+    scale = 1.0 / (high - low)
+    for i in range(arr_flat.shape[0]):
+        # Explicit comparisons so that NaN values fall through unclipped, as in np.clip
+        val = arr_flat[i]
+        if val < low:
+            val = low
+        elif val > high:
+            val = high
+        out_flat[i] = (val - low) * scale
+    return out
+
+
+@jit()
+def euler2quat(euler):
+    """
+    Converts extrinsic xyz euler angles into a quaternion using the closed-form half-angle expansion.
+    Equivalent to transform_utils.euler2quat(euler)
+
+    Args:
+        euler (3-array): (r,p,y) extrinsic xyz euler angles, in radians
+
+    Returns:
+        4-array: (x,y,z,w) unit quaternion
+    """
+    cr, sr = math.cos(euler[0] * 0.5), math.sin(euler[0] * 0.5)
+    cp, sp = math.cos(euler[1] * 0.5), math.sin(euler[1] * 0.5)
+    cy, sy = math.cos(euler[2] * 0.5), math.sin(euler[2] * 0.5)
+
+    out = np.empty(4)
+    out[0] = sr * cp * cy - cr * sp * sy
+    out[1] = cr * sp * cy + sr * cp * sy
+    out[2] = cr * cp * sy - sr * sp * cy
+    out[3] = cr * cp * cy + sr * sp * sy
+    return out
+
+
+def warmup():
+    """
+    Compiles (or loads from the on-disk cache) all kernels in this module by calling each of them once with dummy
+    inputs, so that the one-time JIT compilation cost is not incurred inside the first environment step.
+
+    Since numba compiles a separate signature for every combination of argument dtypes, every float32 / float64
+    combination is warmed up for each kernel. This is needed because callers mix them, e.g.: robot poses from the
+    physics backend are float32 while sampled goal positions are float64. This is a no-op if numba is not available.
+    """
+    if numba is None:
+        return
+
+    dtypes = (np.float32, np.float64)
+    for dtype0, dtype1 in itertools.product(dtypes, repeat=2):
+        l2_distance(np.zeros(2, dtype=dtype0), np.zeros(2, dtype=dtype1))
+        quat_inverse_rotate(np.array([0, 0, 0, 1.0], dtype=dtype0), np.zeros(3, dtype=dtype1))
+    for dtype0, dtype1, dtype2 in itertools.product(dtypes, repeat=3):
+        relative_position(np.zeros(3, dtype=dtype0), np.zeros(3, dtype=dtype1), np.array([0, 0, 0, 1.0], dtype=dtype2))
+    for dtype in dtypes:
+        euler2quat(np.zeros(3, dtype=dtype))
+        for shape in ((1,), (1, 1)):
+            clip_normalize(np.zeros(shape, dtype=dtype), 0.0, 1.0)
@@ -5,7 +5,7 @@ from collections.abc import Iterable
 import omnigibson as og
 from omnigibson.macros import gm
 from omnigibson.utils import python_utils
-import omnigibson.utils.transform_utils as T
+import omnigibson.utils.fastmath_utils as FM
 from omnigibson.utils.usd_utils import BoundingBoxAPI
 from omni.physx import get_physx_simulation_interface
 from omni.isaac.core.utils.prims import is_prim_ancestral, get_prim_type_name, is_prim_no_delete
@@ -332,7 +332,7 @@ def land_object(obj, pos, quat=None, z_offset=None):
     assert og.sim.is_playing(), "Cannot land object while sim is not playing!"
 
     # Set the object's pose
-    quat = T.euler2quat([0, 0, np.random.uniform(0, np.pi * 2)]) if quat is None else quat
+    quat = FM.euler2quat(np.array([0.0, 0.0, np.random.uniform(0, np.pi * 2)])) if quat is None else quat
     place_base_pose(obj, pos, quat, z_offset)
     obj.keep_still()
 
@@ -341,8 +341,9 @@ def land_object(obj, pos, quat=None, z_offset=None):
     land_success = False
     max_simulator_step = int(1.0 / og.sim.get_rendering_dt())
     for _ in range(max_simulator_step):
-        # Run a sim step and see if we have any contacts
-        og.sim.step()
+        # Run a sim step and see if we have any contacts. Nothing needs to be rendered while landing, so we only
+        # step physics, which runs all the physics substeps back-to-back without a full app update in between
+        og.sim.step(render=False)
         land_success = check_collision(prims=obj)
         if land_success:
             # Once we're successful, we can break immediately
@@ -328,9 +328,11 @@ class RigidContactAPI:
                 from @prim_paths_b
         """
         # Compute subset of matrix and return
-        idxs_a = [cls._PATH_TO_IDX[path] for path in prim_paths_a]
-        idxs_b = [cls._PATH_TO_IDX[path] for path in prim_paths_b]
-        return cls.get_all_impulses()[idxs_a][:, idxs_b]
+        # We build the index arrays directly from the paths and gather the (N, M) block in a single indexing pass,
+        # instead of materializing an intermediate (N, N_all, 3) copy from chained indexing
+        idxs_a = np.fromiter((cls._PATH_TO_IDX[path] for path in prim_paths_a), dtype=int, count=len(prim_paths_a))
+        idxs_b = np.fromiter((cls._PATH_TO_IDX[path] for path in prim_paths_b), dtype=int, count=len(prim_paths_b))
+        return cls.get_all_impulses()[np.ix_(idxs_a, idxs_b)]
 
     @classmethod
     def in_contact(cls, prim_paths_a, prim_paths_b):
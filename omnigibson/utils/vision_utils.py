@@ -103,6 +103,10 @@ def segmentation_to_rgb(seg_im, N, colors=None):
         N (int): Maximum segmentation ID from @seg_im
         colors (None or list of 3-array): If specified, colors to apply
             to different segmentation IDs. Otherwise, will be generated randomly
+
+    Returns:
+        (W, H, 3)-array: RGB visualization of @seg_im. This is a uint8 image if @N <= 256,
+            otherwise a float image with values in [0, 1]
     """
     # ensure all values lie within [0, N]
     seg_im = np.mod(seg_im, N)
@@ -113,6 +117,7 @@ def segmentation_to_rgb(seg_im, N, colors=None):
         use_colors = colors
 
     if N <= 256:
-        return (255.0 * use_colors[seg_im]).astype(np.uint8)
+        # Quantize the (N, 3) color palette first, so that the per-pixel work is only a single uint8 gather
+        return (255.0 * np.asarray(use_colors)).astype(np.uint8)[seg_im]
     else:
-        return (use_colors[seg_im]).astype(np.float)
+        return (use_colors[seg_im]).astype(np.float64)
@@ -43,6 +43,10 @@ setup(
         "pymeshlab",
         "click"
     ],
+    extras_require={
+        # Optional JIT compilation of the kernels in omnigibson/utils/fastmath_utils.py
+        "fastmath": ["numba"],
+    },
     tests_require=[],
     python_requires=">=3",
     package_data={"": ["omnigibson/global_config.yaml"]},
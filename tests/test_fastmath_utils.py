@@ -0,0 +1,69 @@
+import omnigibson.utils.fastmath_utils as FM
+import omnigibson.utils.transform_utils as T
+
+import pytest
+import numpy as np
+
+
+N_SAMPLES = 100
+
+
+def get_implementations(kernel):
+    # Check both the JIT-compiled kernel and its underlying python function (identical if numba is not installed)
+    return [kernel, getattr(kernel, "py_func", kernel)]
+
+
+def get_random_quat(rng):
+    quat = rng.normal(size=4)
+    return quat / np.linalg.norm(quat)
+
+
+@pytest.mark.parametrize("kernel", get_implementations(FM.l2_distance))
+def test_l2_distance(kernel):
+    rng = np.random.default_rng(seed=0)
+    for _ in range(N_SAMPLES):
+        v1, v2 = rng.uniform(-10.0, 10.0, size=(2, 3))
+        assert np.isclose(kernel(v1, v2), T.l2_distance(v1, v2))
+        assert np.isclose(kernel(v1[:2], v2[:2]), T.l2_distance(v1[:2], v2[:2]))
+
+
+@pytest.mark.parametrize("kernel", get_implementations(FM.quat_inverse_rotate))
+def test_quat_inverse_rotate(kernel):
+    rng = np.random.default_rng(seed=0)
+    for _ in range(N_SAMPLES):
+        quat, vec = get_random_quat(rng), rng.uniform(-10.0, 10.0, size=3)
+        assert np.allclose(kernel(quat, vec), T.quat2mat(quat).T @ vec)
+
+
+@pytest.mark.parametrize("kernel", get_implementations(FM.relative_position))
+def test_relative_position(kernel):
+    rng = np.random.default_rng(seed=0)
+    for _ in range(N_SAMPLES):
+        pos, base_pos = rng.uniform(-10.0, 10.0, size=(2, 3))
+        base_quat = get_random_quat(rng)
+        rel_pos, _ = T.relative_pose_transform(pos, np.array([0, 0, 0, 1.0]), base_pos, base_quat)
+        assert np.allclose(kernel(pos, base_pos, base_quat), rel_pos)
+
+
+@pytest.mark.parametrize("kernel", get_implementations(FM.euler2quat))
+def test_euler2quat(kernel):
+    rng = np.random.default_rng(seed=0)
+    for _ in range(N_SAMPLES):
+        euler = rng.uniform(-np.pi, np.pi, size=3)
+        quat, quat_ref = kernel(euler), T.euler2quat(euler)
+        # q and -q represent the same rotation
+        assert np.allclose(quat, quat_ref) or np.allclose(quat, -quat_ref)
+        assert np.isclose(np.linalg.norm(quat), 1.0)
+
+
+# Also explicitly check the separate numpy fallback, which is used instead of the python loop if numba is not installed
+@pytest.mark.parametrize("kernel", get_implementations(FM.clip_normalize) + [FM._clip_normalize])
+def test_clip_normalize(kernel):
+    rng = np.random.default_rng(seed=0)
+    low, high = 0.05, 10.0
+    scan = rng.uniform(-5.0, 15.0, size=(N_SAMPLES, 1)).astype(np.float32)
+    # Raw readings may be invalid, which should be handled the same way as np.clip
+    scan[::7], scan[1::11], scan[2::13] = np.nan, np.inf, -np.inf
+    normalized = kernel(scan, low, high)
+    assert normalized.dtype == scan.dtype and normalized.shape == scan.shape
+    assert np.allclose(normalized, (np.clip(scan, low, high) - low) / (high - low), equal_nan=True)